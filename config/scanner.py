@@ -14,5 +14,14 @@ CLOB_API_URL = os.getenv("CLOB_API_URL", "https://clob.polymarket.com")
 MIN_PROFIT_THRESHOLD = float(os.getenv("MIN_PROFIT_THRESHOLD", "0.001"))  # 0.1%
 MIN_VOLUME = float(os.getenv("MIN_VOLUME", "10000"))  # Minimum market volume in USD
 MARKET_LIMIT = int(os.getenv("MARKET_LIMIT", "100"))  # Markets to fetch from Gamma
-BATCH_SIZE = int(os.getenv("BATCH_SIZE", "20"))  # Concurrent orderbook requests
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "20"))  # Concurrent requests, also the connection pool cap
+BOOKS_CHUNK_SIZE = int(os.getenv("BOOKS_CHUNK_SIZE", "50"))  # Tokens per CLOB POST /books request
+TOKEN_FIELDS_CACHE_SIZE = int(os.getenv("TOKEN_FIELDS_CACHE_SIZE", "8192"))  # Memoized Gamma token decodes
+BOOK_CACHE_TTL = float(os.getenv("BOOK_CACHE_TTL", "15"))  # Seconds a fetched orderbook is reused
+BOOK_CACHE_SIZE = int(os.getenv("BOOK_CACHE_SIZE", "10000"))  # Max orderbooks held in the cache
 REQUEST_TIMEOUT = float(os.getenv("REQUEST_TIMEOUT", "15"))  # httpx timeout in seconds
+CONNECT_TIMEOUT = float(os.getenv("CONNECT_TIMEOUT", "5"))  # TCP+TLS connect timeout in seconds
+KEEPALIVE_EXPIRY = float(os.getenv("KEEPALIVE_EXPIRY", "30"))  # Idle pooled connection lifetime in seconds
+REQUEST_ATTEMPTS = int(os.getenv("REQUEST_ATTEMPTS", "3"))  # Tries per request on timeouts, 408, 429 and 5xx
+RETRY_BACKOFF = float(os.getenv("RETRY_BACKOFF", "0.1"))  # First retry delay in seconds, doubled per retry
+RETRY_AFTER_MAX = float(os.getenv("RETRY_AFTER_MAX", "10"))  # Longest Retry-After wait honoured before giving up
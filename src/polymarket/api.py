@@ -7,16 +7,31 @@ with concurrency control and structured error handling.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
+import orjson
+from cachetools import TTLCache
+
+try:
+    import ijson
+except ImportError:  # optional: without it the Gamma payload is parsed in one go
+    ijson = None
 
 from config.scanner import (
     GAMMA_API_URL,
     CLOB_API_URL,
     BATCH_SIZE,
+    BOOKS_CHUNK_SIZE,
+    BOOK_CACHE_TTL,
+    BOOK_CACHE_SIZE,
     REQUEST_TIMEOUT,
+    CONNECT_TIMEOUT,
+    KEEPALIVE_EXPIRY,
+    REQUEST_ATTEMPTS,
+    RETRY_AFTER_MAX,
+    RETRY_BACKOFF,
     MIN_VOLUME,
     MARKET_LIMIT,
 )
@@ -24,12 +39,76 @@ from src.polymarket.models import Market, OrderBook
 
 logger = logging.getLogger(__name__)
 
+# Recently fetched orderbooks by token_id. Reads and writes never span an
+# await, so the single event loop needs no lock around it.
+_book_cache: TTLCache[str, OrderBook] = TTLCache(
+    maxsize=BOOK_CACHE_SIZE, ttl=BOOK_CACHE_TTL
+)
+
+# Client errors worth retrying: request timeout and rate limiting.
+_RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+# Statuses a /books request fails with when one of its tokens is invalid or
+# delisted, so the chunk is worth fetching token by token.
+_BAD_TOKEN_STATUSES = frozenset({400, 404, 422})
+
+
+async def _iter_raw_markets(response: httpx.Response) -> AsyncIterator[dict]:
+    """Yield raw market dicts from a streamed Gamma /markets response.
+
+    With ijson installed the JSON array is parsed incrementally as bytes
+    arrive, so only the markets from the current chunk are held in memory.
+    Without it the body is read and decoded in one go.
+
+    Args:
+        response: An open streaming response for the Gamma /markets endpoint.
+
+    Yields:
+        Raw Gamma market dicts in response order.
+    """
+    if ijson is None:
+        for raw in orjson.loads(await response.aread()):
+            yield raw
+        return
+
+    parsed = ijson.sendable_list()
+    parser = ijson.items_coro(parsed, "item", use_float=True)
+    async for chunk in response.aiter_bytes():
+        parser.send(chunk)
+        for raw in parsed:
+            yield raw
+        del parsed[:]
+    parser.close()
+    for raw in parsed:
+        yield raw
+
+
+def _parse_market(raw: dict) -> Market | None:
+    """Apply volume and CLOB token filters, then parse a raw Gamma market.
+
+    Args:
+        raw: Raw Gamma market dict.
+
+    Returns:
+        Parsed Market, or None if it is filtered out or malformed.
+    """
+    volume = float(raw.get("volume", 0))
+    if volume < MIN_VOLUME:
+        return None
+
+    clob_token_ids = raw.get("clobTokenIds")
+    if not clob_token_ids:
+        return None
+
+    return Market.from_gamma_response(raw)
+
 
 async def fetch_active_markets(client: httpx.AsyncClient) -> list[Market]:
     """Fetch active markets from the Gamma API, filtered by volume.
 
     Markets are ordered by volume descending and filtered to only include
     those with CLOB token IDs and volume above the configured minimum.
+    The response is streamed and filtered market by market.
 
     Args:
         client: Configured httpx async client.
@@ -45,27 +124,95 @@ async def fetch_active_markets(client: httpx.AsyncClient) -> list[Market]:
         "ascending": "false",
     }
 
-    response = await client.get(f"{GAMMA_API_URL}/markets", params=params)
-    response.raise_for_status()
+    markets: list[Market] = []
+    async with client.stream(
+        "GET", f"{GAMMA_API_URL}/markets", params=params
+    ) as response:
+        response.raise_for_status()
+        async for raw in _iter_raw_markets(response):
+            market = _parse_market(raw)
+            if market is not None:
+                markets.append(market)
 
-    raw_markets = response.json()
+    logger.info("Fetched %d active markets from Gamma API", len(markets))
+    return markets
 
-    markets: list[Market] = []
-    for raw in raw_markets:
-        volume = float(raw.get("volume", 0))
-        if volume < MIN_VOLUME:
-            continue
 
-        clob_token_ids = raw.get("clobTokenIds")
-        if not clob_token_ids:
-            continue
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Read a Retry-After header given in seconds.
 
-        market = Market.from_gamma_response(raw)
-        if market is not None:
-            markets.append(market)
+    Args:
+        response: Response that may carry the header.
 
-    logger.info("Fetched %d active markets from Gamma API", len(markets))
-    return markets
+    Returns:
+        The requested delay in seconds, or None if the header is missing or
+        uses the HTTP-date form.
+    """
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+async def _request_with_retry(
+    client: httpx.AsyncClient, method: str, url: str, **kwargs
+) -> httpx.Response:
+    """Send an idempotent request, retrying transient failures.
+
+    Timeouts, 408, 429 and 5xx responses are retried up to REQUEST_ATTEMPTS
+    times in total with exponential backoff starting at RETRY_BACKOFF
+    seconds. A Retry-After header given in seconds replaces the backoff
+    delay; one longer than RETRY_AFTER_MAX ends the retries instead. Other
+    errors, including the remaining 4xx responses, are raised immediately.
+
+    Args:
+        client: Configured httpx async client.
+        method: HTTP method.
+        url: Request URL.
+        **kwargs: Passed through to client.request.
+
+    Returns:
+        The successful response.
+
+    Raises:
+        httpx.HTTPError: The last failure once retries are exhausted, or the
+            first non-retryable one.
+    """
+    attempt = 1
+    while True:
+        delay = RETRY_BACKOFF * 2 ** (attempt - 1)
+        try:
+            response = await client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.TimeoutException:
+            if attempt >= REQUEST_ATTEMPTS:
+                raise
+        except httpx.HTTPStatusError as exc:
+            status = exc.response.status_code
+            if attempt >= REQUEST_ATTEMPTS or (
+                status < 500 and status not in _RETRYABLE_CLIENT_STATUSES
+            ):
+                raise
+            retry_after = _retry_after_seconds(exc.response)
+            if retry_after is not None:
+                if retry_after > RETRY_AFTER_MAX:
+                    raise
+                delay = retry_after
+
+        logger.debug(
+            "Retrying %s %s in %.2fs (attempt %d/%d failed)",
+            method,
+            url,
+            delay,
+            attempt,
+            REQUEST_ATTEMPTS,
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
 
 
 async def fetch_orderbook(
@@ -73,6 +220,10 @@ async def fetch_orderbook(
 ) -> OrderBook | None:
     """Fetch orderbook data for a single CLOB token.
 
+    Books fetched within the last BOOK_CACHE_TTL seconds are served from
+    the cache. Timeouts and 5xx responses are retried with backoff before
+    giving up.
+
     Args:
         client: Configured httpx async client.
         token_id: The CLOB token identifier.
@@ -80,13 +231,24 @@ async def fetch_orderbook(
     Returns:
         Parsed OrderBook or None if the request or parsing failed.
     """
+    cached = _book_cache.get(token_id)
+    if cached is not None:
+        return cached
+
     try:
-        response = await client.get(
-            f"{CLOB_API_URL}/book", params={"token_id": token_id}
+        response = await _request_with_retry(
+            client, "GET", f"{CLOB_API_URL}/book", params={"token_id": token_id}
         )
-        response.raise_for_status()
-        data = response.json()
-        return OrderBook.from_api_response(data, token_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Orderbook for token %s served with content-encoding=%s",
+                token_id,
+                response.headers.get("content-encoding"),
+            )
+        data = orjson.loads(response.content)
+        orderbook = OrderBook.from_api_response(data, token_id)
+        _book_cache[token_id] = orderbook
+        return orderbook
     except httpx.TimeoutException:
         logger.warning("Timeout fetching orderbook for token %s", token_id)
         return None
@@ -103,20 +265,129 @@ async def fetch_orderbook(
             "HTTP error fetching orderbook for token %s: %s", token_id, exc
         )
         return None
-    except (json.JSONDecodeError, KeyError, ValueError, TypeError) as exc:
+    except (orjson.JSONDecodeError, KeyError, ValueError, TypeError) as exc:
         logger.warning(
             "Failed to parse orderbook for token %s: %s", token_id, exc
         )
         return None
 
 
+async def _fetch_orderbooks_individually(
+    client: httpx.AsyncClient, token_ids: list[str]
+) -> dict[str, OrderBook]:
+    """Fetch orderbooks one token at a time, omitting tokens that fail.
+
+    Requests run sequentially so the caller's worker still holds at most
+    one request in flight.
+
+    Args:
+        client: Configured httpx async client.
+        token_ids: CLOB token identifiers to fetch.
+
+    Returns:
+        Dict mapping token_id to its OrderBook for the tokens that succeeded.
+    """
+    orderbooks: dict[str, OrderBook] = {}
+    for token_id in token_ids:
+        orderbook = await fetch_orderbook(client, token_id)
+        if orderbook is not None:
+            orderbooks[token_id] = orderbook
+    return orderbooks
+
+
+async def fetch_orderbooks_chunk(
+    client: httpx.AsyncClient, token_ids: list[str]
+) -> dict[str, OrderBook]:
+    """Fetch orderbooks for several CLOB tokens in one POST /books request.
+
+    Timeouts, 408, 429 and 5xx responses are retried with backoff before
+    giving up. A 400, 404 or 422 response is usually caused by one invalid
+    or delisted token, so the chunk is then fetched token by token via
+    GET /book and only the offending tokens are lost. Any other failure,
+    rate limiting included, drops the chunk rather than multiplying requests.
+
+    Args:
+        client: Configured httpx async client.
+        token_ids: CLOB token identifiers to request together.
+
+    Returns:
+        Dict mapping token_id to its OrderBook. Empty if the request failed
+        with a timeout, an HTTP status other than 400/404/422 or a transport
+        error; books the API omits or that
+        fail to parse are left out.
+    """
+    try:
+        response = await _request_with_retry(
+            client,
+            "POST",
+            f"{CLOB_API_URL}/books",
+            json=[{"token_id": token_id} for token_id in token_ids],
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Orderbooks for %d tokens served with content-encoding=%s",
+                len(token_ids),
+                response.headers.get("content-encoding"),
+            )
+        payload = orjson.loads(response.content)
+    except httpx.TimeoutException:
+        logger.warning("Timeout fetching orderbooks for %d tokens", len(token_ids))
+        return {}
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code in _BAD_TOKEN_STATUSES:
+            logger.warning(
+                "HTTP %d fetching orderbooks for %d tokens, fetching them "
+                "individually: %s",
+                exc.response.status_code,
+                len(token_ids),
+                exc.response.text,
+            )
+            return await _fetch_orderbooks_individually(client, token_ids)
+        logger.warning(
+            "HTTP %d fetching orderbooks for %d tokens: %s",
+            exc.response.status_code,
+            len(token_ids),
+            exc.response.text,
+        )
+        return {}
+    except httpx.HTTPError as exc:
+        logger.warning(
+            "HTTP error fetching orderbooks for %d tokens: %s", len(token_ids), exc
+        )
+        return {}
+    except orjson.JSONDecodeError as exc:
+        logger.warning(
+            "Failed to parse orderbooks for %d tokens: %s", len(token_ids), exc
+        )
+        return {}
+
+    if not isinstance(payload, list):
+        logger.warning(
+            "Unexpected /books response for %d tokens: expected a list, got %s",
+            len(token_ids),
+            type(payload).__name__,
+        )
+        return {}
+
+    orderbooks: dict[str, OrderBook] = {}
+    for data in payload:
+        try:
+            token_id = data["asset_id"]
+            orderbooks[token_id] = OrderBook.from_api_response(data, token_id)
+        except (KeyError, ValueError, TypeError) as exc:
+            logger.warning("Failed to parse orderbook in /books response: %s", exc)
+    return orderbooks
+
+
 async def fetch_orderbooks_batch(
     client: httpx.AsyncClient, token_ids: list[str]
 ) -> dict[str, OrderBook]:
     """Fetch orderbooks for multiple tokens with concurrency control.
 
-    Uses a semaphore limited to BATCH_SIZE concurrent requests to avoid
-    overwhelming the CLOB API.
+    Books still in the TTL cache are reused. The remaining unique token IDs
+    are split into chunks of BOOKS_CHUNK_SIZE, each fetched with a single
+    POST /books request. A fixed pool of BATCH_SIZE workers drains the
+    chunk queue, so at most BATCH_SIZE requests are in flight.
 
     Args:
         client: Configured httpx async client.
@@ -126,28 +397,53 @@ async def fetch_orderbooks_batch(
         Dict mapping token_id to its OrderBook (tokens with failed fetches
         are omitted).
     """
-    semaphore = asyncio.Semaphore(BATCH_SIZE)
-
-    async def _fetch_with_semaphore(token_id: str) -> tuple[str, OrderBook | None]:
-        async with semaphore:
-            orderbook = await fetch_orderbook(client, token_id)
-            return token_id, orderbook
-
-    results = await asyncio.gather(
-        *(_fetch_with_semaphore(tid) for tid in token_ids)
-    )
-
-    return {
-        token_id: orderbook
-        for token_id, orderbook in results
-        if orderbook is not None
-    }
+    results: dict[str, OrderBook] = {}
+    to_fetch: list[str] = []
+    for token_id in dict.fromkeys(token_ids):
+        cached = _book_cache.get(token_id)
+        if cached is None:
+            to_fetch.append(token_id)
+        else:
+            results[token_id] = cached
+
+    queue: asyncio.Queue[list[str]] = asyncio.Queue()
+    for start in range(0, len(to_fetch), BOOKS_CHUNK_SIZE):
+        queue.put_nowait(to_fetch[start : start + BOOKS_CHUNK_SIZE])
+
+    async def _worker() -> None:
+        while True:
+            try:
+                chunk = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            fetched = await fetch_orderbooks_chunk(client, chunk)
+            _book_cache.update(fetched)
+            results.update(fetched)
+
+    num_workers = min(BATCH_SIZE, queue.qsize())
+    await asyncio.gather(*(_worker() for _ in range(num_workers)))
+
+    return results
 
 
 def create_client() -> httpx.AsyncClient:
     """Create a configured httpx async client for Polymarket API calls.
 
+    The client speaks HTTP/2 so concurrent orderbook requests are multiplexed
+    over a single TLS connection per host. BATCH_SIZE doubles as the pool cap,
+    so every in-flight request can hold a keep-alive connection without
+    evicting another. httpx negotiates gzip and deflate compression by
+    default and also advertises and decodes br when Brotli is installed.
+
     Returns:
-        An httpx.AsyncClient with the configured request timeout.
+        An httpx.AsyncClient with HTTP/2, pool limits and timeouts configured.
     """
-    return httpx.AsyncClient(timeout=REQUEST_TIMEOUT)
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=BATCH_SIZE,
+            max_keepalive_connections=BATCH_SIZE,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
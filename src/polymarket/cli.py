@@ -25,6 +25,15 @@ COLUMN_YES_WIDTH = 9
 COLUMN_NO_WIDTH = 9
 COLUMN_SIZE_WIDTH = 12
 COLUMN_MAX_PROFIT_WIDTH = 14
+TRUNCATION_MARKER = "..."
+MARKET_NAME_KEEP = COLUMN_MARKET_WIDTH - len(TRUNCATION_MARKER)
+
+
+def _truncate_market_name(name: str) -> str:
+    """Shorten a market name to fit the Market column, marking cuts with '...'."""
+    if len(name) > COLUMN_MARKET_WIDTH:
+        return name[:MARKET_NAME_KEEP] + TRUNCATION_MARKER
+    return name
 
 
 def format_table(opportunities: list[Opportunity]) -> str:
@@ -34,7 +43,7 @@ def format_table(opportunities: list[Opportunity]) -> str:
     YES Price, NO Price, Max Size, Max Profit USD (all right-aligned).
 
     Args:
-        opportunities: List of Opportunity dataclass instances to display.
+        opportunities: List of Opportunity instances to display.
 
     Returns:
         A multi-line string containing the formatted ASCII table.
@@ -51,25 +60,18 @@ def format_table(opportunities: list[Opportunity]) -> str:
 
     separator = "-" * len(header)
 
-    lines = [header, separator]
-
-    for opp in opportunities:
-        market_name = opp.market_question
-        if len(market_name) > COLUMN_MARKET_WIDTH:
-            market_name = market_name[: COLUMN_MARKET_WIDTH - 3] + "..."
+    rows = [
+        f"{_truncate_market_name(opp.market_question):<{COLUMN_MARKET_WIDTH}} "
+        f"{opp.arb_type:>{COLUMN_TYPE_WIDTH}} "
+        f"{opp.profit_pct * 100:>{COLUMN_PROFIT_WIDTH}.2f} "
+        f"{opp.yes_price:>{COLUMN_YES_WIDTH}.4f} "
+        f"{opp.no_price:>{COLUMN_NO_WIDTH}.4f} "
+        f"{opp.max_size:>{COLUMN_SIZE_WIDTH}.2f} "
+        f"{opp.max_profit_usd:>{COLUMN_MAX_PROFIT_WIDTH}.2f}"
+        for opp in opportunities
+    ]
 
-        row = (
-            f"{market_name:<{COLUMN_MARKET_WIDTH}} "
-            f"{opp.arb_type:>{COLUMN_TYPE_WIDTH}} "
-            f"{opp.profit_pct * 100:>{COLUMN_PROFIT_WIDTH}.2f} "
-            f"{opp.yes_price:>{COLUMN_YES_WIDTH}.4f} "
-            f"{opp.no_price:>{COLUMN_NO_WIDTH}.4f} "
-            f"{opp.max_size:>{COLUMN_SIZE_WIDTH}.2f} "
-            f"{opp.max_profit_usd:>{COLUMN_MAX_PROFIT_WIDTH}.2f}"
-        )
-        lines.append(row)
-
-    return "\n".join(lines)
+    return "\n".join([header, separator, *rows])
 
 
 async def run() -> int:
@@ -106,15 +108,13 @@ async def run() -> int:
         logger.info("Scan completed in %.2f seconds", elapsed)
 
         if opportunities:
-            # Sort by profit percentage descending
-            opportunities.sort(key=lambda o: o.profit_pct, reverse=True)
-
             print("\nPolymarket Arbitrage Scanner")
             print("=" * 40)
             print()
             print(format_table(opportunities))
             print()
-            best_profit = max(o.profit_pct for o in opportunities)
+            # scan_markets returns opportunities sorted best-first
+            best_profit = opportunities[0].profit_pct
             print(
                 f"Found {len(opportunities)} opportunity(ies). "
                 f"Best profit: {best_profit * 100:.2f}%"
@@ -1,91 +1,120 @@
-"""Dataclass models for Polymarket API data structures."""
+"""Data models for Polymarket API data structures."""
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import sys
 from dataclasses import dataclass, field
+from typing import NamedTuple
 
-logger = logging.getLogger(__name__)
+import orjson
 
+from config.scanner import TOKEN_FIELDS_CACHE_SIZE
 
-@dataclass
-class OrderBook:
-    """Represents an order book for a single token on Polymarket CLOB.
+logger = logging.getLogger(__name__)
 
-    Bids are sorted descending by price (highest first).
-    Asks are sorted ascending by price (lowest first).
-    Prices and sizes arrive as strings from the API and are converted to float on access.
-    """
 
-    bids: list[dict[str, str]]
-    asks: list[dict[str, str]]
+class TokenRef(NamedTuple):
+    """A market's CLOB token and the outcome it pays out on."""
+
     token_id: str
+    outcome: str
 
-    def __post_init__(self) -> None:
-        """Sort bids descending and asks ascending by price."""
-        self.bids = sorted(
-            self.bids, key=lambda b: float(b.get("price", "0")), reverse=True
-        )
-        self.asks = sorted(
-            self.asks, key=lambda a: float(a.get("price", "0"))
+
+def _looks_like_json_array(value: object) -> bool:
+    """Cheap shape check for a JSON-encoded array string, run before decoding."""
+    return isinstance(value, str) and value.startswith("[") and value.endswith("]")
+
+
+@functools.lru_cache(maxsize=TOKEN_FIELDS_CACHE_SIZE)
+def _parse_token_fields(clob_token_ids: str, outcomes: str) -> tuple[TokenRef, ...]:
+    """Decode Gamma's JSON-encoded token IDs and outcomes into TokenRefs.
+
+    Memoized on the raw strings, so markets seen again on later polls skip
+    both JSON decodes. The result is immutable and shared between markets.
+    Outcome labels repeat across markets ("Yes"/"No") and are interned.
+
+    Args:
+        clob_token_ids: JSON string like '["token1", "token2"]'.
+        outcomes: JSON string like '["Yes", "No"]'.
+
+    Returns:
+        TokenRefs in order, truncated to the shorter of the two lists.
+    """
+    return tuple(
+        TokenRef(token_id, sys.intern(outcome))
+        for token_id, outcome in zip(
+            orjson.loads(clob_token_ids), orjson.loads(outcomes)
         )
+    )
 
-    @property
-    def best_bid(self) -> float | None:
-        """Highest bid price, or None if no bids exist."""
-        if not self.bids:
-            return None
-        return float(self.bids[0]["price"])
 
-    @property
-    def best_ask(self) -> float | None:
-        """Lowest ask price, or None if no asks exist."""
-        if not self.asks:
-            return None
-        return float(self.asks[0]["price"])
+@dataclass(slots=True)
+class OrderBook:
+    """Top of the order book for a single token on Polymarket CLOB.
 
-    @property
-    def best_bid_size(self) -> float | None:
-        """Size at the best bid, or None if no bids exist."""
-        if not self.bids:
-            return None
-        return float(self.bids[0]["size"])
+    Only the best level on each side is kept, parsed to float once when the
+    API response is read. All best_* fields are None when that side is empty.
+    """
 
-    @property
-    def best_ask_size(self) -> float | None:
-        """Size at the best ask, or None if no asks exist."""
-        if not self.asks:
-            return None
-        return float(self.asks[0]["size"])
+    best_bid: float | None
+    best_bid_size: float | None
+    best_ask: float | None
+    best_ask_size: float | None
+    token_id: str
 
     @classmethod
     def from_api_response(cls, data: dict, token_id: str) -> OrderBook:
         """Parse a CLOB API order book response into an OrderBook instance.
 
+        The best bid (highest price) and best ask (lowest price) are found
+        in a single linear pass over each side. No ordering of the API's
+        levels is assumed, so books are never sorted.
+
         Args:
             data: Raw API response dict, expected to contain "bids" and "asks" lists.
             token_id: The token ID this order book belongs to.
 
         Returns:
-            An OrderBook instance with parsed bids and asks.
+            An OrderBook instance holding the best bid and ask levels.
         """
-        bids = data.get("bids", []) or []
-        asks = data.get("asks", []) or []
-        return cls(bids=bids, asks=asks, token_id=token_id)
+        # Only prices are parsed while scanning; the size string is parsed
+        # once, for the winning level, after each pass.
+        best_bid = best_bid_level = None
+        for bid in data.get("bids") or []:
+            price = float(bid["price"])
+            if best_bid is None or price > best_bid:
+                best_bid = price
+                best_bid_level = bid
+
+        best_ask = best_ask_level = None
+        for ask in data.get("asks") or []:
+            price = float(ask["price"])
+            if best_ask is None or price < best_ask:
+                best_ask = price
+                best_ask_level = ask
+
+        return cls(
+            best_bid=best_bid,
+            best_bid_size=None if best_bid_level is None else float(best_bid_level["size"]),
+            best_ask=best_ask,
+            best_ask_size=None if best_ask_level is None else float(best_ask_level["size"]),
+            token_id=token_id,
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Market:
     """Represents a Polymarket prediction market from the Gamma API.
 
-    Tokens are stored as a list of dicts with "token_id" and "outcome" keys.
+    Tokens are stored as a tuple of TokenRef (token_id, outcome) pairs.
     """
 
     condition_id: str
     question: str
     slug: str
-    tokens: list[dict[str, str]]
+    tokens: tuple[TokenRef, ...]
     active: bool
     volume: float
     event_slug: str = ""
@@ -94,8 +123,8 @@ class Market:
     def from_gamma_response(cls, data: dict) -> Market | None:
         """Parse a Gamma API market response into a Market instance.
 
-        The Gamma API returns clobTokenIds and outcomePrices as JSON-encoded strings,
-        and outcomes as a comma-separated string (e.g. "Yes, No").
+        The Gamma API returns clobTokenIds and outcomes as JSON-encoded strings.
+        outcomePrices is ignored; prices come from the CLOB order books.
 
         Args:
             data: Raw Gamma API response dict for a single market.
@@ -110,26 +139,24 @@ class Market:
             active = data.get("active", False)
             volume = float(data.get("volume", 0))
 
-            # event_slug is nested inside events[0].slug
+            # event_slug is nested inside events[0].slug and shared by sibling
+            # markets of the same event, so it is interned
             events = data.get("events", [])
-            event_slug = events[0].get("slug", "") if events else ""
-
-            # clobTokenIds is a JSON string like '["token1", "token2"]'
-            token_ids = json.loads(data["clobTokenIds"])
-
-            # outcomePrices is a JSON string like '["0.55", "0.45"]'
-            outcome_prices_raw = data.get("outcomePrices", "[]")
-            json.loads(outcome_prices_raw)  # validate it parses, prices stored on order book
-
-            # outcomes is a JSON string like '["Yes", "No"]'
-            outcomes_raw = data.get("outcomes", "[]")
-            outcomes = json.loads(outcomes_raw)
-
-            # Build token list by zipping token IDs with their outcomes
-            tokens = [
-                {"token_id": tid, "outcome": outcome}
-                for tid, outcome in zip(token_ids, outcomes)
-            ]
+            event_slug = sys.intern(events[0].get("slug") or "") if events else ""
+
+            clob_token_ids = data["clobTokenIds"]
+            outcomes = data.get("outcomes", "[]")
+            # Reject obviously malformed fields without raising a decode error
+            if not (
+                _looks_like_json_array(clob_token_ids)
+                and _looks_like_json_array(outcomes)
+            ):
+                logger.warning(
+                    "Malformed token fields in Gamma market %s", condition_id
+                )
+                return None
+
+            tokens = _parse_token_fields(clob_token_ids, outcomes)
 
             return cls(
                 condition_id=condition_id,
@@ -140,15 +167,17 @@ class Market:
                 volume=volume,
                 event_slug=event_slug,
             )
-        except (KeyError, json.JSONDecodeError, ValueError, TypeError) as exc:
+        except (KeyError, orjson.JSONDecodeError, ValueError, TypeError) as exc:
             logger.warning("Failed to parse Gamma market response: %s", exc)
             return None
 
 
-@dataclass
-class Opportunity:
+class Opportunity(NamedTuple):
     """Represents a detected arbitrage or trading opportunity.
 
+    A NamedTuple rather than a dataclass: it is created for every hit in
+    the scan loop and never mutated, and tuple construction is cheaper.
+
     Attributes:
         market_question: The market question text.
         arb_type: Type of arbitrage - "BUY", "SELL", or "MULTI".
@@ -158,7 +187,6 @@ class Opportunity:
         yes_price: Current YES token price.
         no_price: Current NO token price.
         event_slug: Slug of the parent event.
-        details: Human-readable description of the opportunity.
     """
 
     market_question: str
@@ -169,4 +197,3 @@ class Opportunity:
     yes_price: float
     no_price: float
     event_slug: str = ""
-    details: str = ""
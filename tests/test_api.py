@@ -0,0 +1,356 @@
+"""Tests for Polymarket API client functions."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+try:
+    import ijson
+except ImportError:  # streamed parsing is optional; the buffered path is still tested
+    ijson = None
+
+from src.polymarket.models import OrderBook
+from src.polymarket.api import (
+    _book_cache,
+    fetch_active_markets,
+    fetch_orderbook,
+    fetch_orderbooks_batch,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_book_cache():
+    """Start every test with an empty orderbook cache."""
+    _book_cache.clear()
+    yield
+    _book_cache.clear()
+
+
+def _book_payload(bid: str = "0.45", ask: str = "0.55") -> dict:
+    """Helper to build a minimal CLOB /book response body."""
+    return {
+        "bids": [{"price": bid, "size": "100"}],
+        "asks": [{"price": ask, "size": "100"}],
+    }
+
+
+def _gamma_market(condition_id: str, volume: float, clob_token_ids: str | None) -> dict:
+    """Helper to build a raw Gamma /markets entry."""
+    return {
+        "conditionId": condition_id,
+        "question": f"Question {condition_id}?",
+        "slug": condition_id,
+        "outcomes": '["Yes", "No"]',
+        "clobTokenIds": clob_token_ids,
+        "outcomePrices": '["0.5", "0.5"]',
+        "active": True,
+        "volume": volume,
+    }
+
+
+class TestFetchActiveMarkets:
+    """Tests for fetch_active_markets function."""
+
+    GAMMA_MARKETS = [
+        _gamma_market("0xkeep", 50000.0, '["t1", "t2"]'),
+        _gamma_market("0xlow", 10.0, '["t3", "t4"]'),
+        _gamma_market("0xnotokens", 50000.0, None),
+    ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "ijson_module",
+        [
+            pytest.param(
+                ijson,
+                id="streamed",
+                marks=pytest.mark.skipif(ijson is None, reason="ijson not installed"),
+            ),
+            pytest.param(None, id="buffered"),
+        ],
+    )
+    async def test_filters_volume_and_missing_tokens(self, ijson_module) -> None:
+        """Low-volume markets and markets without CLOB tokens are dropped."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=self.GAMMA_MARKETS)
+
+        with (
+            patch("src.polymarket.api.MIN_VOLUME", 10000.0),
+            patch("src.polymarket.api.ijson", ijson_module),
+        ):
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                markets = await fetch_active_markets(client)
+
+        assert [m.condition_id for m in markets] == ["0xkeep"]
+        assert markets[0].tokens[1].token_id == "t2"
+
+
+class TestFetchOrderbookRetry:
+    """Tests for retry behaviour of fetch_orderbook."""
+
+    @staticmethod
+    async def _fetch(handler) -> OrderBook | None:
+        """Fetch one orderbook through handler with backoff disabled."""
+        with patch("src.polymarket.api.RETRY_BACKOFF", 0.0):
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                return await fetch_orderbook(client, "token")
+
+    @pytest.mark.asyncio
+    async def test_server_error_retried(self) -> None:
+        """A 5xx response is retried and a later success is returned."""
+        statuses = iter([503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json=_book_payload())
+
+        book = await self._fetch(handler)
+
+        assert book is not None
+        assert book.best_bid == 0.45
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self) -> None:
+        """A 4xx response fails immediately without retrying."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(404, text="not found")
+
+        assert await self._fetch(handler) is None
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retried_after_header(self) -> None:
+        """A 429 is retried after the delay its Retry-After header asks for."""
+        statuses = iter([429, 200])
+        delays: list[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                next(statuses), headers={"retry-after": "2"}, json=_book_payload()
+            )
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        with patch("src.polymarket.api.asyncio.sleep", fake_sleep):
+            book = await self._fetch(handler)
+
+        assert book is not None
+        assert delays == [2.0]
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_not_waited(self) -> None:
+        """A Retry-After beyond RETRY_AFTER_MAX gives up instead of waiting."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(429, headers={"retry-after": "3600"})
+
+        with patch("src.polymarket.api.RETRY_AFTER_MAX", 10.0):
+            assert await self._fetch(handler) is None
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_timeouts_exhaust_attempts(self) -> None:
+        """Persistent timeouts give up after REQUEST_ATTEMPTS tries."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        with patch("src.polymarket.api.REQUEST_ATTEMPTS", 3):
+            assert await self._fetch(handler) is None
+        assert calls == 3
+
+
+def _books_handler(fail_token: str | None = None):
+    """Helper building a POST /books handler that echoes one book per token.
+
+    Requests containing fail_token get a 500; fail_token itself is never returned.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        token_ids = [entry["token_id"] for entry in json.loads(request.content)]
+        if fail_token in token_ids:
+            return httpx.Response(500, text="server error")
+        return httpx.Response(
+            200,
+            json=[{"asset_id": tid, **_book_payload()} for tid in token_ids],
+        )
+
+    return handler
+
+
+class TestFetchOrderbooksBatch:
+    """Tests for fetch_orderbooks_batch function."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_chunked_into_books_requests(self) -> None:
+        """Tokens are fetched BOOKS_CHUNK_SIZE at a time via POST /books."""
+        requests: list[httpx.Request] = []
+        echo = _books_handler()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return echo(request)
+
+        token_ids = [f"token_{i}" for i in range(5)]
+        with patch("src.polymarket.api.BOOKS_CHUNK_SIZE", 2):
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                books = await fetch_orderbooks_batch(client, token_ids)
+
+        assert set(books) == set(token_ids)
+        assert books["token_3"].token_id == "token_3"
+        assert len(requests) == 3
+        assert all(r.method == "POST" and r.url.path == "/books" for r in requests)
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_omitted(self) -> None:
+        """Tokens in a chunk whose request fails with a 5xx are left out."""
+        with (
+            patch("src.polymarket.api.BOOKS_CHUNK_SIZE", 2),
+            patch("src.polymarket.api.RETRY_BACKOFF", 0.0),
+        ):
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(_books_handler(fail_token="bad"))
+            ) as client:
+                books = await fetch_orderbooks_batch(client, ["a", "b", "bad", "c"])
+
+        assert set(books) == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_client_error_chunk_fetched_per_token(self) -> None:
+        """A 4xx chunk falls back to GET /book so only the bad token is lost."""
+        echo = _books_handler()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                if request.url.params["token_id"] == "bad":
+                    return httpx.Response(404, text="not found")
+                return httpx.Response(200, json=_book_payload())
+            if "bad" in [e["token_id"] for e in json.loads(request.content)]:
+                return httpx.Response(400, text="invalid token")
+            return echo(request)
+
+        with patch("src.polymarket.api.BOOKS_CHUNK_SIZE", 2):
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                books = await fetch_orderbooks_batch(client, ["a", "b", "bad", "c"])
+
+        assert set(books) == {"a", "b", "c"}
+        assert books["c"].token_id == "c"
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_chunk_not_fanned_out(self) -> None:
+        """A chunk still rate limited after retries is dropped, not fanned out."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(429, headers={"retry-after": "0"})
+
+        token_ids = [f"token_{i}" for i in range(4)]
+        with (
+            patch("src.polymarket.api.BOOKS_CHUNK_SIZE", 2),
+            patch("src.polymarket.api.REQUEST_ATTEMPTS", 3),
+        ):
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                books = await fetch_orderbooks_batch(client, token_ids)
+
+        assert books == {}
+        assert len(requests) == 6
+        assert all(r.method == "POST" for r in requests)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [None, {"asset_id": "x"}], ids=["null", "object"])
+    async def test_non_list_body_omitted(self, body) -> None:
+        """A /books body that is not a list yields no books instead of raising."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=body)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            books = await fetch_orderbooks_batch(client, ["x"])
+
+        assert books == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped_by_batch_size(self) -> None:
+        """No more than BATCH_SIZE requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+        echo = _books_handler()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return echo(request)
+
+        token_ids = [f"token_{i}" for i in range(10)]
+        with (
+            patch("src.polymarket.api.BATCH_SIZE", 3),
+            patch("src.polymarket.api.BOOKS_CHUNK_SIZE", 1),
+        ):
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                books = await fetch_orderbooks_batch(client, token_ids)
+
+        assert set(books) == set(token_ids)
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_and_duplicate_tokens_not_refetched(self) -> None:
+        """Tokens fetched earlier, or repeated in the request, are requested once."""
+        requested: list[str] = []
+        echo = _books_handler()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.extend(e["token_id"] for e in json.loads(request.content))
+            return echo(request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await fetch_orderbooks_batch(client, ["a", "b", "a"])
+            books = await fetch_orderbooks_batch(client, ["a", "b", "c"])
+            single = await fetch_orderbook(client, "c")
+
+        assert set(books) == {"a", "b", "c"}
+        assert single is books["c"]
+        assert requested == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_empty_token_list(self) -> None:
+        """An empty request list returns an empty dict without any requests."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("no request expected")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            books = await fetch_orderbooks_batch(client, [])
+
+        assert books == {}
@@ -0,0 +1,48 @@
+"""Tests for Polymarket scanner CLI output formatting."""
+
+from __future__ import annotations
+
+from src.polymarket.cli import COLUMN_MARKET_WIDTH, format_table
+from src.polymarket.models import Opportunity
+
+
+def _make_opportunity(question: str) -> Opportunity:
+    """Helper to create an Opportunity instance for tests."""
+    return Opportunity(
+        market_question=question,
+        arb_type="BUY",
+        profit_pct=0.05,
+        max_size=80.0,
+        max_profit_usd=4.0,
+        yes_price=0.45,
+        no_price=0.50,
+    )
+
+
+class TestFormatTable:
+    """Tests for format_table function."""
+
+    def test_header_separator_and_rows(self) -> None:
+        """One line per opportunity after the header and separator."""
+        table = format_table(
+            [_make_opportunity("Market A"), _make_opportunity("Market B")]
+        )
+
+        lines = table.split("\n")
+        assert len(lines) == 4
+        assert lines[0].startswith("Market")
+        assert set(lines[1]) == {"-"}
+        assert lines[2].startswith("Market A")
+        assert lines[2].split()[-5:] == ["5.00", "0.4500", "0.5000", "80.00", "4.00"]
+
+    def test_long_market_name_truncated(self) -> None:
+        """Names longer than the Market column are cut and end with '...'."""
+        long_name = "x" * (COLUMN_MARKET_WIDTH + 10)
+
+        row = format_table([_make_opportunity(long_name)]).split("\n")[2]
+
+        assert row[:COLUMN_MARKET_WIDTH] == "x" * (COLUMN_MARKET_WIDTH - 3) + "..."
+
+    def test_empty_list(self) -> None:
+        """No opportunities yields just the header and separator."""
+        assert len(format_table([]).split("\n")) == 2
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.polymarket.models import OrderBook, Market
+from src.polymarket.models import OrderBook, Market, _parse_token_fields
 
 
 class TestOrderBookFromApiResponse:
@@ -42,8 +42,8 @@ class TestOrderBookFromApiResponse:
         assert book.best_bid_size is None
         assert book.best_ask_size is None
 
-    def test_orderbook_string_price_sorting(self) -> None:
-        """Verify bids are sorted descending and asks ascending even with unsorted input."""
+    def test_orderbook_unsorted_levels(self) -> None:
+        """Best bid is the highest price and best ask the lowest, whatever the input order."""
         data: dict = {
             "bids": [
                 {"price": "0.30", "size": "10"},
@@ -67,13 +67,27 @@ class TestOrderBookFromApiResponse:
         assert book.best_ask == 0.55
         assert book.best_ask_size == 30.0
 
-        # Verify full sort order: bids descending
-        bid_prices = [float(b["price"]) for b in book.bids]
-        assert bid_prices == [0.50, 0.40, 0.30]
+    def test_orderbook_best_level_last(self) -> None:
+        """Books listed worst-to-best (best level last) still yield the best levels."""
+        data: dict = {
+            "bids": [
+                {"price": "0.01", "size": "500"},
+                {"price": "0.20", "size": "40"},
+                {"price": "0.48", "size": "12"},
+            ],
+            "asks": [
+                {"price": "0.99", "size": "500"},
+                {"price": "0.80", "size": "40"},
+                {"price": "0.52", "size": "7"},
+            ],
+        }
+
+        book = OrderBook.from_api_response(data, token_id="token_reversed")
 
-        # Verify full sort order: asks ascending
-        ask_prices = [float(a["price"]) for a in book.asks]
-        assert ask_prices == [0.55, 0.60, 0.70]
+        assert book.best_bid == 0.48
+        assert book.best_bid_size == 12.0
+        assert book.best_ask == 0.52
+        assert book.best_ask_size == 7.0
 
 
 class TestMarketFromGammaResponse:
@@ -105,10 +119,10 @@ class TestMarketFromGammaResponse:
 
         # Tokens should be parsed from JSON string fields
         assert len(market.tokens) == 2
-        assert market.tokens[0]["token_id"] == "token_yes_123"
-        assert market.tokens[0]["outcome"] == "Yes"
-        assert market.tokens[1]["token_id"] == "token_no_456"
-        assert market.tokens[1]["outcome"] == "No"
+        assert market.tokens[0].token_id == "token_yes_123"
+        assert market.tokens[0].outcome == "Yes"
+        assert market.tokens[1].token_id == "token_no_456"
+        assert market.tokens[1].outcome == "No"
 
     def test_market_from_gamma_response_malformed(self) -> None:
         """Malformed clobTokenIds returns None."""
@@ -127,6 +141,59 @@ class TestMarketFromGammaResponse:
 
         assert market is None
 
+    def test_market_shared_strings_interned(self) -> None:
+        """Outcome labels and event slugs are interned across markets."""
+        markets = [
+            Market.from_gamma_response(
+                {
+                    "conditionId": f"0xintern{i}",
+                    "question": f"Intern {i}?",
+                    "outcomes": '["Yes", "No"]',
+                    "clobTokenIds": f'["intern_yes_{i}", "intern_no_{i}"]',
+                    "events": [{"slug": "".join(["shared-", "event"])}],
+                }
+            )
+            for i in range(2)
+        ]
+
+        assert markets[0].tokens[0].outcome is markets[1].tokens[0].outcome
+        assert markets[0].event_slug is markets[1].event_slug
+
+    def test_market_token_fields_memoized(self) -> None:
+        """Repeated token field strings are decoded once and then served from cache."""
+        data: dict = {
+            "conditionId": "0xmemo",
+            "question": "Seen twice?",
+            "outcomes": '["Up", "Down"]',
+            "clobTokenIds": '["memo_up", "memo_down"]',
+        }
+
+        first = Market.from_gamma_response(data)
+        hits_before = _parse_token_fields.cache_info().hits
+        second = Market.from_gamma_response(data)
+
+        assert _parse_token_fields.cache_info().hits == hits_before + 1
+        assert first is not None and second is not None
+        assert second.tokens is first.tokens
+
+    def test_market_from_gamma_response_malformed_prices_ignored(self) -> None:
+        """Malformed outcomePrices does not reject an otherwise valid market."""
+        data: dict = {
+            "conditionId": "0xabc",
+            "question": "Prices unparseable",
+            "slug": "bad-prices",
+            "outcomes": '["Yes", "No"]',
+            "clobTokenIds": '["t1", "t2"]',
+            "outcomePrices": "not-json",
+            "active": True,
+            "volume": 1000.0,
+        }
+
+        market = Market.from_gamma_response(data)
+
+        assert market is not None
+        assert len(market.tokens) == 2
+
     def test_market_from_gamma_missing_fields(self) -> None:
         """Missing required fields (condition_id, clobTokenIds) returns None."""
         # Missing conditionId entirely
@@ -2,30 +2,34 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.polymarket.models import Market, OrderBook, Opportunity
-from src.polymarket.scanner import check_binary_arbitrage, check_multi_outcome_arbitrage
+from src.polymarket.models import Market, OrderBook, Opportunity, TokenRef
+from src.polymarket.scanner import (
+    check_binary_arbitrage,
+    check_multi_outcome_arbitrage,
+    scan_markets,
+)
 
 
 def _make_market(
     question: str = "Test market",
-    tokens: list[dict[str, str]] | None = None,
+    tokens: list[TokenRef] | None = None,
     event_slug: str = "test-event",
 ) -> Market:
     """Helper to create a Market instance for tests."""
     if tokens is None:
         tokens = [
-            {"token_id": "yes_token", "outcome": "Yes"},
-            {"token_id": "no_token", "outcome": "No"},
+            TokenRef("yes_token", "Yes"),
+            TokenRef("no_token", "No"),
         ]
     return Market(
         condition_id="0xtest",
         question=question,
         slug="test-market",
-        tokens=tokens,
+        tokens=tuple(tokens),
         active=True,
         volume=100000.0,
         event_slug=event_slug,
@@ -44,9 +48,11 @@ def _make_orderbook(
         bids: List of (price, size) tuples for bid side.
         asks: List of (price, size) tuples for ask side.
     """
-    bid_dicts = [{"price": p, "size": s} for p, s in (bids or [])]
-    ask_dicts = [{"price": p, "size": s} for p, s in (asks or [])]
-    return OrderBook(bids=bid_dicts, asks=ask_dicts, token_id=token_id)
+    data = {
+        "bids": [{"price": p, "size": s} for p, s in (bids or [])],
+        "asks": [{"price": p, "size": s} for p, s in (asks or [])],
+    }
+    return OrderBook.from_api_response(data, token_id=token_id)
 
 
 class TestCheckBinaryArbitrage:
@@ -116,7 +122,7 @@ class TestCheckBinaryArbitrage:
 
         opps = check_binary_arbitrage(market, yes_book, no_book)
 
-        assert opps == []
+        assert opps == ()
 
     def test_empty_orderbook_skipped(self) -> None:
         """One book has no asks/bids - should return empty list without crashing."""
@@ -131,7 +137,7 @@ class TestCheckBinaryArbitrage:
 
         opps = check_binary_arbitrage(market, yes_book, no_book)
 
-        assert opps == []
+        assert opps == ()
 
     def test_below_threshold_filtered(self) -> None:
         """Profit just below MIN_PROFIT_THRESHOLD (0.1% = 0.001) is filtered out."""
@@ -150,7 +156,7 @@ class TestCheckBinaryArbitrage:
         with patch("src.polymarket.scanner.MIN_PROFIT_THRESHOLD", 0.001):
             opps = check_binary_arbitrage(market, yes_book, no_book)
 
-        assert opps == []
+        assert opps == ()
 
 
 class TestCheckMultiOutcomeArbitrage:
@@ -210,4 +216,90 @@ class TestCheckMultiOutcomeArbitrage:
             event_slug="no-arb-event",
         )
 
-        assert opps == []
+        assert opps == ()
+
+    def test_multi_outcome_sell_with_missing_asks(self) -> None:
+        """An outcome without asks disables BUY but SELL is still detected."""
+        books: list[tuple[str, OrderBook]] = [
+            (
+                "Outcome A",
+                _make_orderbook(token_id="token_a", bids=[("0.40", "50")]),
+            ),
+            (
+                "Outcome B",
+                _make_orderbook(
+                    token_id="token_b",
+                    bids=[("0.35", "40")],
+                    asks=[("0.10", "90")],
+                ),
+            ),
+            (
+                "Outcome C",
+                _make_orderbook(
+                    token_id="token_c",
+                    bids=[("0.35", "60")],
+                    asks=[("0.10", "90")],
+                ),
+            ),
+        ]
+
+        opps = check_multi_outcome_arbitrage(
+            market_question="Sell only",
+            books=books,
+            event_slug="sell-event",
+        )
+
+        assert len(opps) == 1
+        opp = opps[0]
+        assert opp.no_price == pytest.approx(1.10, abs=1e-9)
+        assert opp.profit_pct == pytest.approx(0.10, abs=1e-9)
+        assert opp.max_size == 40.0  # min of 50, 40, 60
+
+
+class TestScanMarkets:
+    """Tests for scan_markets function."""
+
+    @pytest.mark.asyncio
+    async def test_skips_incomplete_markets_and_sorts(self) -> None:
+        """Markets missing any orderbook are skipped; results are best-first."""
+        small_arb = _make_market(
+            question="Small arb",
+            tokens=[
+                TokenRef("s_yes", "Yes"),
+                TokenRef("s_no", "No"),
+            ],
+        )
+        big_arb = _make_market(
+            question="Big arb",
+            tokens=[
+                TokenRef("b_yes", "Yes"),
+                TokenRef("b_no", "No"),
+            ],
+        )
+        incomplete = _make_market(
+            question="Incomplete multi",
+            tokens=[
+                TokenRef("m_a", "A"),
+                TokenRef("m_b", "B"),
+                TokenRef("m_missing", "C"),
+            ],
+        )
+        orderbooks = {
+            "s_yes": _make_orderbook("s_yes", asks=[("0.49", "10")]),
+            "s_no": _make_orderbook("s_no", asks=[("0.49", "10")]),
+            "b_yes": _make_orderbook("b_yes", asks=[("0.40", "10")]),
+            "b_no": _make_orderbook("b_no", asks=[("0.40", "10")]),
+            "m_a": _make_orderbook("m_a", asks=[("0.10", "10")]),
+            "m_b": _make_orderbook("m_b", asks=[("0.10", "10")]),
+        }
+
+        with patch(
+            "src.polymarket.scanner.fetch_orderbooks_batch",
+            AsyncMock(return_value=orderbooks),
+        ) as fetch:
+            opps = await scan_markets(None, [small_arb, incomplete, big_arb])
+
+        assert fetch.await_args.args[1] == [
+            "s_yes", "s_no", "m_a", "m_b", "m_missing", "b_yes", "b_no"
+        ]
+        assert [o.market_question for o in opps] == ["Big arb", "Small arb"]